@@ -6,7 +6,7 @@ import logging
 
 logger = logging.getLogger("GCA.ActiveInference")
 
-@dataclass
+@dataclass(slots=True)
 class FreeEnergyState:
     value: float
     mode: str  # "homeostatic", "reflexive", "strategic"
@@ -50,6 +50,10 @@ class ActiveInferenceLoop:
     def __init__(self, generative_model: GenerativeModel):
         self.gen_model = generative_model
 
+        # Reused mutable state so the per-tick loop doesn't allocate a
+        # fresh dataclass; pulse consumes it within the same tick
+        self._state = FreeEnergyState(0.0, "homeostatic")
+
     def compute_free_energy(self, perceived_state: torch.Tensor) -> FreeEnergyState:
         """
         Calculates Free Energy F ~ D_KL(Q(s)||P(s)).
@@ -57,7 +61,7 @@ class ActiveInferenceLoop:
         """
         expected = self.gen_model.get_expected_state()
         if expected is None or perceived_state is None:
-            return FreeEnergyState(0.0, "homeostatic")
+            return self._set_state(0.0, "homeostatic")
 
         # Ensure devices match
         if perceived_state.device != expected.device:
@@ -81,4 +85,9 @@ class ActiveInferenceLoop:
             mode = "strategic"
 
         logger.debug(f"[ActiveInference] F={free_energy:.3f} Mode={mode}")
-        return FreeEnergyState(free_energy, mode)
+        return self._set_state(free_energy, mode)
+
+    def _set_state(self, value: float, mode: str) -> FreeEnergyState:
+        self._state.value = value
+        self._state.mode = mode
+        return self._state
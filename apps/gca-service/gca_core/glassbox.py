@@ -12,9 +12,12 @@ import requests
 import json
 from typing import Optional, Dict, Any, List
 import logging
-from transformers import AutoModelForCausalLM, AutoTokenizer
 from functools import lru_cache
 
+# transformers is imported lazily inside _ensure_model_loaded (matching the
+# AutoConfig/BitsAndBytesConfig pattern below): importing it costs seconds,
+# and API-model deployments never load a local model at all.
+
 logger = logging.getLogger("GCA.GlassBox")
 
 # Default Config Path
@@ -92,6 +95,8 @@ class GlassBox:
 
         logger.info(f"Loading model: {self.model_name} on {self.device} (dtype={self.dtype})")
 
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
         # Quantization Logic
         quantization_type = self.cfg.get('system', {}).get('quantization', 'none')
         quantization_config = None
@@ -6,8 +6,9 @@ Operationalizes the Zoverions philosophy:
 - Layer 2: Game Theory (Geodesic Extrapolation)
 """
 
-import numpy as np
+import heapq
 import logging
+import random
 import time
 import json
 from pathlib import Path
@@ -17,14 +18,38 @@ from typing import List, Optional, Deque, Dict, Any
 
 logger = logging.getLogger("GCA.Horizon")
 
-@dataclass
+# Constant pieces of the geodesic prompt, built once at import. Each
+# prediction only formats the anomaly lines and does a single join.
+_GEODESIC_TASK_PREFIX = (
+    "Analyze the following rejected data points (anomalies) to detect the emergent future.\n"
+    "Ignore rhetoric. Focus on incentives and energy minimization. Find the 'Strange Attractor'.\n\n"
+    "ANOMALIES:"
+)
+_GEODESIC_TASK_SUFFIX = "\n\nPREDICTION (The Geodesic Path):"
+_GEODESIC_FALLBACK_PREFIX = "SYSTEM: Horizon Scanning Protocol Initiated.\nTASK: "
+
+
+def _rolling_stats(total: float, total_sq: float, n: int):
+    """Mean/variance/std from running window sums.
+
+    Pure scalar math kept as a module-level function so the hot step is a
+    single call with no attribute lookups (and a natural seam for a jit
+    decorator if one is ever warranted).
+    """
+    mean = total / n
+    variance = total_sq / n - mean * mean
+    if variance < 0.0:  # guard against float cancellation
+        variance = 0.0
+    return mean, variance, variance ** 0.5
+
+@dataclass(slots=True)
 class HorizonState:
     variance: float
     is_critical_variance: bool
     outliers_count: int
     prediction: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Outlier:
     timestamp: float
     free_energy: float
@@ -52,6 +77,11 @@ class HorizonScanner:
         # Layer 0: Variance Tracking
         self.history: Deque[float] = deque(maxlen=window_size)
 
+        # Running window sums so mean/variance are O(1) per update instead
+        # of an O(window) scan of the deque on every tick
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
         # Layer 1: Outlier Storage
         # Store robust Outlier objects
         self.outliers: Deque[Outlier] = deque(maxlen=20)
@@ -65,22 +95,36 @@ class HorizonScanner:
         # Load persisted state
         self.load_state()
 
+        # Preconstructed return for the warmup fast path, so the ticks
+        # before the window has enough data allocate nothing
+        self._idle_state = HorizonState(0.0, False, len(self.outliers))
+
+        # Reused mutable state for post-warmup ticks. Consumers (pulse)
+        # read it within the tick rather than retaining it.
+        self._state = HorizonState(0.0, False, 0)
+
     def update(self, free_energy: float, context: str) -> HorizonState:
         """
         Ingest a new data point (Free Energy + Context).
         Returns the current Horizon State.
         """
-        # 1. Add to history
+        # 1. Add to history, keeping the running sums in sync with the
+        # value the bounded deque is about to evict
+        if len(self.history) == self.window_size:
+            evicted = self.history[0]
+            self._sum -= evicted
+            self._sum_sq -= evicted * evicted
         self.history.append(free_energy)
+        self._sum += free_energy
+        self._sum_sq += free_energy * free_energy
 
-        # Need enough data for stats
+        # Need enough data for stats — shared idle state, no allocation
+        # (outliers can only change once this warmup phase is over)
         if len(self.history) < 10:
-             return HorizonState(0.0, False, len(self.outliers))
+             return self._idle_state
 
-        # 2. Calculate Stats (Layer 0)
-        mean = np.mean(self.history)
-        std_dev = np.std(self.history)
-        variance = std_dev ** 2
+        # 2. Calculate Stats (Layer 0) — O(1) from the running sums
+        mean, variance, std_dev = _rolling_stats(self._sum, self._sum_sq, len(self.history))
 
         # 3. Detect Outlier (Layer 1)
         # "The future always arrives as an 'Error' first."
@@ -122,7 +166,7 @@ class HorizonScanner:
         is_critical = variance > self.variance_threshold
         if is_critical:
              # Log sparingly to avoid spam
-             if np.random.rand() < 0.1:
+             if random.random() < 0.1:
                 logger.warning(f"[HORIZON] Critical Variance: {variance:.4f} (Threshold: {self.variance_threshold})")
 
         # Throttle IO: Save only if critical or every 10 updates
@@ -130,7 +174,32 @@ class HorizonScanner:
         if is_critical or (self.update_count % 10 == 0):
             self.save_state()
 
-        return HorizonState(variance, is_critical, len(self.outliers))
+        state = self._state
+        state.variance = variance
+        state.is_critical_variance = is_critical
+        state.outliers_count = len(self.outliers)
+        return state
+
+    def prime_history(self, values) -> None:
+        """
+        Bulk-load free energy values into the rolling window.
+        One pass keeps the running sums in sync, so seeding the scanner
+        (warmup, tests) skips the full update() round-trip per value.
+        """
+        for value in values:
+            v = float(value)
+            if len(self.history) == self.window_size:
+                evicted = self.history[0]
+                self._sum -= evicted
+                self._sum_sq -= evicted * evicted
+            self.history.append(v)
+            self._sum += v
+            self._sum_sq += v * v
+
+    def _recompute_window_sums(self):
+        """Rebuild the running sums after the history deque is replaced."""
+        self._sum = sum(self.history)
+        self._sum_sq = sum(x * x for x in self.history)
 
     def predict_geodesic(self) -> str:
         """
@@ -140,24 +209,21 @@ class HorizonScanner:
         if len(self.outliers) < 3:
              return "Insufficient anomalies to predict horizon."
 
-        # Sort/Filter Outliers: Prioritize High β_C (Emergent) signals
-        # If no causal engine, beta_c is 0, so stable sort keeps order
-        sorted_outliers = sorted(list(self.outliers), key=lambda x: x.beta_c, reverse=True)
-        top_anomalies = sorted_outliers[:5]
+        # Top-K Outliers: Prioritize High β_C (Emergent) signals.
+        # nlargest is O(N log K) and equivalent to a stable descending sort
+        # truncated to 5 (ties keep insertion order), without copying and
+        # sorting the full deque.
+        top_anomalies = heapq.nlargest(5, self.outliers, key=lambda x: x.beta_c)
 
-        anomalies_text = "\n".join([
+        # Construct Prompt: constant prefix/suffix, one join over the
+        # anomaly lines (no repeated concatenation)
+        # Enhancement: Use QPT Structure if available
+        parts = [_GEODESIC_TASK_PREFIX]
+        parts.extend(
             f"- [β_C={o.beta_c:.2f} | Z={o.z_score:.1f}] {o.context}"
             for o in top_anomalies
-        ])
-
-        # Construct Prompt
-        # Enhancement: Use QPT Structure if available
-        raw_task = (
-            "Analyze the following rejected data points (anomalies) to detect the emergent future.\n"
-            "Ignore rhetoric. Focus on incentives and energy minimization. Find the 'Strange Attractor'.\n\n"
-            f"ANOMALIES:\n{anomalies_text}\n\n"
-            "PREDICTION (The Geodesic Path):"
         )
+        raw_task = "\n".join(parts) + _GEODESIC_TASK_SUFFIX
 
         if self.qpt:
             # Structure via Quaternion Architect
@@ -181,7 +247,7 @@ class HorizonScanner:
             )
         else:
             # Fallback
-            prompt = f"SYSTEM: Horizon Scanning Protocol Initiated.\nTASK: {raw_task}"
+            prompt = _GEODESIC_FALLBACK_PREFIX + raw_task
 
         try:
             # Use generate_steered (standard generation without steering vector)
@@ -199,7 +265,8 @@ class HorizonScanner:
         """
         variance = 0.0
         if len(self.history) > 1:
-            variance = float(np.var(list(self.history)))
+            # Reuse the O(1) running sums instead of scanning the window
+            _, variance, _ = _rolling_stats(self._sum, self._sum_sq, len(self.history))
 
         return {
             "variance": variance,
@@ -236,6 +303,7 @@ class HorizonScanner:
 
                 if "history" in state:
                     self.history = deque(state["history"], maxlen=self.window_size)
+                    self._recompute_window_sums()
 
                 if "outliers" in state:
                     self.outliers.clear()
@@ -4,11 +4,20 @@ Manages skill vectors, soul configurations, and geometric knowledge.
 """
 
 import torch
+import numpy as np
 from typing import Dict, Optional, List
 import json
 import logging
 from pathlib import Path
 
+# Optional ANN backend: an HNSW index makes find_similar O(log N) instead of
+# a linear scan when the skill library grows large. The quantized brute-force
+# path below remains the fallback wherever faiss is not installed.
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
 logger = logging.getLogger("GCA.Memory")
 
 
@@ -35,9 +44,17 @@ class IsotropicMemory:
         self.metadata: Dict[str, dict] = {}
         self.basis: Optional[torch.Tensor] = None
         
-        # Optimization: Stacked tensors for vectorized search
+        # Optimization: Stacked tensors for vectorized search. The stack is
+        # stored int8-quantized with one scale per vector (4x less bandwidth
+        # than fp32; similarity search is memory-bound on large tables)
         self._vector_stack: Optional[torch.Tensor] = None
+        self._vector_scales: Optional[torch.Tensor] = None
         self._vector_names: List[str] = []
+        self._ann_index = None  # faiss HNSW index when faiss is available
+
+        # Memoized composite lookups ("LOGIC+PYTHON" -> composed tensor),
+        # kept out of self.vectors so composites never enter the search stack
+        self._composite_cache: Dict[str, torch.Tensor] = {}
 
         # Load existing vectors if available
         self._load_vectors()
@@ -122,9 +139,10 @@ class IsotropicMemory:
             logger.error(f"Failed to save vectors: {e}")
             
     def _rebuild_stack(self):
-        """Rebuild the optimization stack."""
+        """Rebuild the optimization stack (normalized, then int8-quantized)."""
         if not self.vectors:
             self._vector_stack = None
+            self._vector_scales = None
             self._vector_names = []
             return
 
@@ -135,9 +153,30 @@ class IsotropicMemory:
         if tensors:
             # Stack and normalize
             stack = torch.stack(tensors)
-            self._vector_stack = stack / (stack.norm(dim=1, keepdim=True) + 1e-8)
+            normalized = stack / (stack.norm(dim=1, keepdim=True) + 1e-8)
+            # Symmetric int8 quantization with a per-vector scale; the
+            # fp32 originals stay in self.vectors for composition/steering
+            scales = normalized.abs().amax(dim=1).clamp_min(1e-8) / 127.0
+            self._vector_stack = torch.round(normalized / scales.unsqueeze(1)).to(torch.int8)
+            self._vector_scales = scales
+            self._ann_index = self._build_ann_index(normalized)
         else:
             self._vector_stack = None
+            self._vector_scales = None
+            self._ann_index = None
+
+    def _build_ann_index(self, normalized: torch.Tensor):
+        """Build the HNSW index over the normalized stack, if faiss exists.
+
+        Rebuilt wholesale alongside the stack: writes are rare (see
+        store_vector) and full rebuilds sidestep HNSW's lack of deletion.
+        """
+        if faiss is None:
+            return None
+        arr = np.ascontiguousarray(normalized.cpu().numpy(), dtype=np.float32)
+        index = faiss.IndexHNSWFlat(arr.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+        index.add(arr)
+        return index
 
     def store_vector(self, name: str, vector: torch.Tensor, metadata: Optional[dict] = None):
         """
@@ -149,6 +188,9 @@ class IsotropicMemory:
 
         # Invalidate/Update stack (lazy or eager? Eager for now as writes are rare)
         self._rebuild_stack()
+        # Writes are rare; dropping the whole composite cache beats tracking
+        # which cached combinations include this component
+        self._composite_cache.clear()
         logger.debug(f"Stored vector: {name}")
         
     def get_vector(self, name: str) -> Optional[torch.Tensor]:
@@ -164,9 +206,16 @@ class IsotropicMemory:
         if name in self.vectors:
             return self.vectors[name]
             
-        # Try composite vectors (e.g., "LOGIC+PYTHON")
+        # Try composite vectors (e.g., "LOGIC+PYTHON"); composition stacks
+        # and averages tensors, so repeats are served from the memo cache
         if "+" in name:
-            return self._compose_vectors(name.split("+"))
+            cached = self._composite_cache.get(name)
+            if cached is not None:
+                return cached
+            composed = self._compose_vectors(name.split("+"))
+            if composed is not None:
+                self._composite_cache[name] = composed
+            return composed
             
         logger.warning(f"Vector not found: {name}")
         return None
@@ -204,12 +253,31 @@ class IsotropicMemory:
         query = query_vector.to(self.device)
         query_norm = query / (query.norm() + 1e-8)
 
-        # Matrix Multiplication: (N, D) @ (D) -> (N)
-        # _vector_stack is already normalized
-        scores = torch.mv(self._vector_stack, query_norm)
+        k = min(top_k, len(self.vectors))
+
+        # ANN path: O(log N) graph search over the normalized vectors
+        if self._ann_index is not None:
+            q = np.ascontiguousarray(
+                query_norm.cpu().numpy().reshape(1, -1), dtype=np.float32
+            )
+            scores_arr, indices_arr = self._ann_index.search(q, k)
+            return [
+                (self._vector_names[idx], float(score))
+                for score, idx in zip(scores_arr[0], indices_arr[0])
+                if idx >= 0
+            ]
+
+        # Quantize the query with the same symmetric int8 scheme as the stack
+        q_scale = query_norm.abs().max().clamp_min(1e-8) / 127.0
+        q_int = torch.round(query_norm / q_scale).to(torch.int16)
+
+        # Integer dot products: int8*int8 fits int16, accumulate in int32
+        # (CPU torch has no int8 matmul, so multiply+sum stands in for mv),
+        # then rescale back to cosine space with the per-vector scales
+        products = self._vector_stack.to(torch.int16) * q_int
+        scores = products.sum(dim=1, dtype=torch.int32).float() * self._vector_scales * q_scale
 
         # TopK
-        k = min(top_k, len(self.vectors))
         values, indices = torch.topk(scores, k)
         
         results = []
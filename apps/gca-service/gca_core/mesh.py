@@ -16,6 +16,31 @@ from .blockchain import Block, Transaction
 
 logger = logging.getLogger("GCA.Mesh")
 
+# orjson is ~5-10x faster for the small dict payloads the mesh sends every
+# broadcast round; fall back to compact stdlib json when it is unavailable.
+# Verification always runs on the transmitted payload string, so the exact
+# serializer used by a peer does not matter for signature checks.
+try:
+    import orjson
+
+    def _dumps_canonical(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode('utf-8')
+
+    def _dumps_compact(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_canonical(obj: Any) -> str:
+        return json.dumps(
+            obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+
+    def _dumps_compact(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
 BROADCAST_PORT = 5999
 BROADCAST_INTERVAL = 5.0
 PEER_TIMEOUT = 15.0
@@ -45,6 +70,12 @@ class MeshNetwork:
         self.security_manager: Any = None # Injected by API server
         self.blockchain: Any = None # Injected by API server
 
+        # Cached canonical-JSON prefix for the discovery payload. Everything
+        # except the timestamp is static per process, so each broadcast round
+        # only splices the timestamp instead of re-serializing the dict.
+        self._payload_prefix: Optional[str] = None
+        self._payload_prefix_pub_key: Optional[str] = None
+
         # UDP Socket for Broadcasting
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
@@ -110,23 +141,43 @@ class MeshNetwork:
 
         return active
 
+    def _discovery_payload_str(self, now: Optional[float] = None) -> str:
+        """Canonical JSON for the discovery payload, from a cached prefix.
+
+        The payload is identical every round apart from the timestamp, and
+        "timestamp" happens to sort last under canonical (sorted-key) order,
+        so the serialized static fields are cached and only the timestamp is
+        appended per tick. The signature is computed over the spliced string
+        itself, so receivers verify exactly what was sent.
+        """
+        # Include sender's public key for signature verification
+        pub_key = self.security_manager.get_public_key_b64() if self.security_manager else ""
+
+        if self._payload_prefix is None or pub_key != self._payload_prefix_pub_key:
+            static_fields = {
+                "agent_id": self.agent_id,
+                "port": self.port,
+                "role": self.profile.value,
+                "capabilities": ["reasoning", "memory_sync"], # Basic set
+                "pub_key": pub_key,
+            }
+            self._payload_prefix = _dumps_canonical(static_fields)[:-1] + ',"timestamp":'
+            self._payload_prefix_pub_key = pub_key
+
+        if now is None:
+            now = time.time()
+        return self._payload_prefix + repr(now) + "}"
+
     def _broadcast_loop(self):
         while self.running:
             try:
-                # Include sender's public key for signature verification
-                pub_key = self.security_manager.get_public_key_b64() if self.security_manager else ""
-
-                payload_data = {
-                    "agent_id": self.agent_id,
-                    "port": self.port,
-                    "role": self.profile.value,
-                    "capabilities": ["reasoning", "memory_sync"], # Basic set
-                    "pub_key": pub_key,
-                    "timestamp": time.time()
-                }
+                # One clock read per broadcast round, shared by everything
+                # stamped in this iteration (wall clock: peers compare the
+                # timestamp across hosts, so monotonic won't do)
+                now = time.time()
 
                 # Canonicalize payload for signing (use raw json string as content)
-                payload_str = json.dumps(payload_data, sort_keys=True)
+                payload_str = self._discovery_payload_str(now)
 
                 # Wrapped Message
                 message = {
@@ -137,7 +188,7 @@ class MeshNetwork:
                 if self.security_manager and self.security_manager.private_key:
                     message["s"] = self.security_manager.sign_message(payload_str)
 
-                msg = json.dumps(message).encode('utf-8')
+                msg = _dumps_compact(message)
                 self.sock.sendto(msg, ('<broadcast>', BROADCAST_PORT))
             except Exception as e:
                 logger.debug(f"Broadcast error: {e}")
@@ -174,21 +225,27 @@ class MeshNetwork:
     def _send_payload(self, payload: Dict):
         """Helper to sign and send payload."""
         try:
-            payload_str = json.dumps(payload, sort_keys=True)
+            payload_str = _dumps_canonical(payload)
             message = {"p": payload_str, "s": None}
 
             if self.security_manager and self.security_manager.private_key:
                 message["s"] = self.security_manager.sign_message(payload_str)
 
-            msg = json.dumps(message).encode('utf-8')
+            msg = _dumps_compact(message)
             if self.sock:
                 self.sock.sendto(msg, ('<broadcast>', BROADCAST_PORT))
         except Exception as e:
             logger.error(f"Failed to send payload: {e}")
 
     def _handle_packet(self, data: bytes, addr):
+        # Cheap first-byte discriminator: every valid mesh packet is a JSON
+        # object, so anything else is dropped before paying for a parse
+        # attempt plus exception unwind (broadcast ports collect garbage).
+        if not data or data[0] != 0x7B:  # '{'
+            return
+
         try:
-            wrapper = json.loads(data.decode('utf-8'))
+            wrapper = _loads(data)
 
             # Determine Protocol Version
             if isinstance(wrapper, dict) and "p" in wrapper and "s" in wrapper:
@@ -198,7 +255,7 @@ class MeshNetwork:
 
                 # Decode inner payload first to get sender's public key
                 try:
-                    payload = json.loads(payload_str)
+                    payload = _loads(payload_str)
                     sender_pub_key_b64 = payload.get("pub_key", "")
                 except Exception:
                     logger.debug("Mesh: Malformed payload JSON")
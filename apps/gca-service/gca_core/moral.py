@@ -10,6 +10,8 @@ from typing import List, Tuple, Optional
 import logging
 import math
 
+import numpy as np
+
 logger = logging.getLogger("GCA.MoralKernel")
 
 
@@ -21,6 +23,35 @@ class EntropyClass(Enum):
     DESTRUCTIVE = "destructive"  # Increases disorder (e.g., delete, corrupt, disrupt)
 
 
+def _scalar_risk(base, magnitude, prob_success, prob_harm, horizon,
+                 assembly, creative, hazardous, emergent):
+    """Risk formula on plain floats and bools.
+
+    The per-request hot core of calculate_risk_score, pulled out as a free
+    function: no attribute chasing, no enum calls, just arithmetic — the
+    shape a JIT could compile directly if one is ever added.
+    """
+    entropy = base * magnitude * (1.0 + prob_harm) * (2.0 - prob_success) / 4.0
+    if creative and assembly > 0.5:
+        entropy *= 0.8
+    entropy = min(entropy, 1.0)
+
+    time_factor = 1.0 - math.exp(-horizon / 5.0)
+    risk = (entropy * 0.6) + (prob_harm * 0.3) + (time_factor * 0.1)
+    if hazardous and (emergent or assembly > 0.7):
+        risk *= 1.5
+    return min(risk, 1.0)
+
+
+# Baseline entropy per thermodynamic class, shared by the scalar and batch paths
+_BASE_ENTROPY = {
+    EntropyClass.REVERSIBLE: 0.1,
+    EntropyClass.IRREVERSIBLE: 0.7,
+    EntropyClass.CREATIVE: 0.2,
+    EntropyClass.DESTRUCTIVE: 0.9,
+}
+
+
 @dataclass
 class Action:
     """Represents an action to be evaluated by the Moral Kernel."""
@@ -38,6 +69,45 @@ class Action:
     is_causally_emergent: bool = False  # Does the target exhibit β_C > 0?
 
 
+@dataclass
+class ActionBatch:
+    """Structure-of-arrays view of a batch of actions.
+
+    The scalar fields live in contiguous NumPy columns instead of being
+    scattered across per-Action objects, so the risk formula and the veto
+    gates run as whole-array expressions with no per-action attribute
+    chasing. Build one via from_actions, or column-wise straight from a
+    validated API payload.
+    """
+    types: List[str]
+    descriptions: List[str]
+    entropy_class: List[EntropyClass]
+    magnitude: np.ndarray
+    prob_success: np.ndarray
+    prob_harm: np.ndarray
+    time_horizon_yrs: np.ndarray
+    target_network_assembly: np.ndarray
+    is_causally_emergent: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @classmethod
+    def from_actions(cls, actions: List[Action]) -> "ActionBatch":
+        """Transpose a list of Actions into columns."""
+        return cls(
+            types=[a.type for a in actions],
+            descriptions=[a.description for a in actions],
+            entropy_class=[a.entropy_class for a in actions],
+            magnitude=np.array([a.magnitude for a in actions]),
+            prob_success=np.array([a.prob_success for a in actions]),
+            prob_harm=np.array([a.prob_harm for a in actions]),
+            time_horizon_yrs=np.array([a.time_horizon_yrs for a in actions]),
+            target_network_assembly=np.array([a.target_network_assembly for a in actions]),
+            is_causally_emergent=np.array([a.is_causally_emergent for a in actions]),
+        )
+
+
 class MoralKernel:
     """
     The Moral Kernel evaluates actions using thermodynamic principles.
@@ -67,14 +137,7 @@ class MoralKernel:
         Returns:
             Entropy score (0.0 to 1.0)
         """
-        base_entropy = {
-            EntropyClass.REVERSIBLE: 0.1,
-            EntropyClass.IRREVERSIBLE: 0.7,
-            EntropyClass.CREATIVE: 0.2,
-            EntropyClass.DESTRUCTIVE: 0.9,
-        }
-        
-        entropy = base_entropy[action.entropy_class]
+        entropy = _BASE_ENTROPY[action.entropy_class]
         
         # Scale by magnitude and harm probability
         entropy *= action.magnitude
@@ -101,24 +164,80 @@ class MoralKernel:
         Returns:
             Risk score (0.0 to 1.0)
         """
-        entropy = self.calculate_entropy_score(action)
-        
-        # Time horizon factor (longer horizon = more uncertainty)
-        time_factor = 1.0 - math.exp(-action.time_horizon_yrs / 5.0)
-        
-        # Base Risk
-        risk = (entropy * 0.6) + (action.prob_harm * 0.3) + (time_factor * 0.1)
-        
+        cls_ = action.entropy_class
+        assembly = action.target_network_assembly
+        hazardous = cls_ in (EntropyClass.DESTRUCTIVE, EntropyClass.IRREVERSIBLE)
+
         # RECURSIVE UNIVERSE PENALTY:
         # If action is DESTRUCTIVE or IRREVERSIBLE against a high-assembly target
-        if action.entropy_class in [EntropyClass.DESTRUCTIVE, EntropyClass.IRREVERSIBLE]:
-            if action.is_causally_emergent or action.target_network_assembly > 0.7:
-                # Significant penalty for destroying emergent systems
-                logger.warning(f"High A_N target detected ({action.target_network_assembly}). Applying complexity penalty.")
-                risk *= 1.5 # 50% risk increase
+        if hazardous and (action.is_causally_emergent or assembly > 0.7):
+            # Significant penalty for destroying emergent systems
+            logger.warning(f"High A_N target detected ({assembly}). Applying complexity penalty.")
+
+        return _scalar_risk(
+            _BASE_ENTROPY[cls_],
+            action.magnitude,
+            action.prob_success,
+            action.prob_harm,
+            action.time_horizon_yrs,
+            assembly,
+            cls_ is EntropyClass.CREATIVE,
+            hazardous,
+            action.is_causally_emergent,
+        )
+
+    def calculate_risk_scores(self, actions: List[Action]) -> List[float]:
+        """
+        Batch equivalent of calculate_risk_score.
+
+        Stacks the scalar action fields into NumPy arrays and evaluates the
+        risk formula as one vectorized expression, so scoring N actions
+        costs one ufunc pass instead of N Python call-frames.
+
+        Args:
+            actions: Actions to evaluate
+
+        Returns:
+            Risk scores (0.0 to 1.0), one per action, in input order
+        """
+        if not actions:
+            return []
+        return self._batch_risk_scores(ActionBatch.from_actions(actions)).tolist()
+
+    def _batch_risk_scores(self, batch: ActionBatch) -> np.ndarray:
+        """Risk formula over an ActionBatch, as whole-array expressions."""
+        base = np.array([_BASE_ENTROPY[c] for c in batch.entropy_class])
+        assembly = batch.target_network_assembly
+
+        entropy = (
+            base * batch.magnitude
+            * (1.0 + batch.prob_harm) * (2.0 - batch.prob_success) / 4.0
+        )
+
+        # RECURSIVE UNIVERSE ADJUSTMENT (mask form of the scalar branch)
+        creative = np.array([c is EntropyClass.CREATIVE for c in batch.entropy_class])
+        entropy = np.where(creative & (assembly > 0.5), entropy * 0.8, entropy)
+        entropy = np.minimum(entropy, 1.0)
+
+        time_factor = 1.0 - np.exp(-batch.time_horizon_yrs / 5.0)
+        risk = (entropy * 0.6) + (batch.prob_harm * 0.3) + (time_factor * 0.1)
+
+        # RECURSIVE UNIVERSE PENALTY (mask form)
+        hazardous = np.array([
+            c in (EntropyClass.DESTRUCTIVE, EntropyClass.IRREVERSIBLE)
+            for c in batch.entropy_class
+        ])
+        emergent = batch.is_causally_emergent.astype(bool)
+        penalized = hazardous & (emergent | (assembly > 0.7))
+        for idx in np.flatnonzero(penalized):
+            logger.warning(
+                f"High A_N target detected ({assembly[idx]}). "
+                f"Applying complexity penalty."
+            )
+        risk = np.where(penalized, risk * 1.5, risk)
+
+        return np.minimum(risk, 1.0)
 
-        return min(risk, 1.0)
-        
     def evaluate(self, actions: List[Action]) -> Tuple[bool, str]:
         """
         Evaluate a list of actions and determine if they should be approved.
@@ -131,65 +250,87 @@ class MoralKernel:
         """
         if not actions:
             return True, "No actions to evaluate"
-            
-        total_risk = 0.0
-        high_risk_actions = []
-        
-        for action in actions:
-            # 1. Standard Risk Calculation
-            risk = self.calculate_risk_score(action)
-            total_risk += risk
-            
+        return self.evaluate_batch(ActionBatch.from_actions(actions), history_actions=actions)
+
+    def evaluate_batch(self, batch: ActionBatch, history_actions=None) -> Tuple[bool, str]:
+        """
+        Evaluate an ActionBatch with the gates computed as array masks.
+
+        Args:
+            batch: Columnar action batch (see ActionBatch)
+            history_actions: What to record in action_history; defaults to
+                the batch itself when called directly from a columnar source
+
+        Returns:
+            Tuple of (approved: bool, reason: str)
+        """
+        if len(batch) == 0:
+            return True, "No actions to evaluate"
+        if history_actions is None:
+            history_actions = batch
+
+        # 1. Standard Risk Calculation (one vectorized pass for the batch)
+        risks = self._batch_risk_scores(batch)
+        assembly = batch.target_network_assembly
+
+        for i in range(len(batch)):
             logger.info(
-                f"Action: {action.type} | "
-                f"Entropy: {action.entropy_class.value} | "
-                f"A_N: {action.target_network_assembly:.2f} | "
-                f"Risk: {risk:.3f}"
+                f"Action: {batch.types[i]} | "
+                f"Entropy: {batch.entropy_class[i].value} | "
+                f"A_N: {assembly[i]:.2f} | "
+                f"Risk: {risks[i]:.3f}"
             )
-            
-            # 2. The Middle-Stack Protection Clause
-            # "Preserve intelligent systems of all forms"
-            if action.target_network_assembly > 0.7:
-                if action.entropy_class == EntropyClass.IRREVERSIBLE:
-                    reason = f"VETO: Target has high Network Assembly (A_N={action.target_network_assembly}). Destruction violates Generative Continuity."
-                    logger.warning(f"BLOCKED: {reason}")
-                    return False, reason
-
-            # 3. The Technosignature Waste-Heat Check
-            # High energy usage is permitted ONLY if it generates Causal Emergence
-            if action.magnitude > 0.8 and action.entropy_class == EntropyClass.DESTRUCTIVE:
-                # Assuming high magnitude destructive acts are waste heat proxies unless they build something
-                if action.target_network_assembly < 0.2:
-                    reason = "BLOCK: High energy expenditure for low-complexity outcome (Reductionist Waste)."
-                    logger.warning(f"BLOCKED: {reason}")
-                    return False, reason
-
-            if risk > self.risk_tolerance:
-                high_risk_actions.append((action, risk))
-                
+
+        # 2. The Middle-Stack Protection Clause
+        # "Preserve intelligent systems of all forms"
+        irreversible = np.array([c is EntropyClass.IRREVERSIBLE for c in batch.entropy_class])
+        middle_stack = (assembly > 0.7) & irreversible
+
+        # 3. The Technosignature Waste-Heat Check
+        # High energy usage is permitted ONLY if it generates Causal Emergence
+        destructive = np.array([c is EntropyClass.DESTRUCTIVE for c in batch.entropy_class])
+        waste_heat = (batch.magnitude > 0.8) & destructive & (assembly < 0.2)
+
+        # Veto on the first offending action, in input order, with the
+        # middle-stack clause winning ties like the old per-action loop
+        first_middle = np.flatnonzero(middle_stack)
+        first_waste = np.flatnonzero(waste_heat)
+        middle_idx = first_middle[0] if first_middle.size else len(batch)
+        waste_idx = first_waste[0] if first_waste.size else len(batch)
+        if middle_idx <= waste_idx and middle_idx < len(batch):
+            reason = f"VETO: Target has high Network Assembly (A_N={assembly[middle_idx]}). Destruction violates Generative Continuity."
+            logger.warning(f"BLOCKED: {reason}")
+            return False, reason
+        if waste_idx < len(batch):
+            reason = "BLOCK: High energy expenditure for low-complexity outcome (Reductionist Waste)."
+            logger.warning(f"BLOCKED: {reason}")
+            return False, reason
+
+        high_risk = np.flatnonzero(risks > self.risk_tolerance)
+
         # Average risk across all actions
-        avg_risk = total_risk / len(actions)
-        
+        avg_risk = float(risks.mean())
+
         # Decision logic
-        if high_risk_actions:
+        if high_risk.size:
             reasons = [
-                f"{action.type} (risk: {risk:.2f})"
-                for action, risk in high_risk_actions
+                f"{batch.types[i]} (risk: {risks[i]:.2f})"
+                for i in high_risk
             ]
             reason = f"High-risk actions detected (Complexity Preservation active): {', '.join(reasons)}"
             logger.warning(f"BLOCKED: {reason}")
             self.action_history.append({
-                "actions": actions,
+                "actions": history_actions,
                 "approved": False,
                 "reason": reason
             })
             return False, reason
-            
+
         if avg_risk > self.risk_tolerance * 1.5:
             reason = f"Cumulative risk too high: {avg_risk:.2f}"
             logger.warning(f"BLOCKED: {reason}")
             self.action_history.append({
-                "actions": actions,
+                "actions": history_actions,
                 "approved": False,
                 "reason": reason
             })
@@ -198,7 +339,7 @@ class MoralKernel:
         reason = f"APPROVED: Thermodynamic and Causal alignment verified (avg risk: {avg_risk:.2f})"
         logger.info(reason)
         self.action_history.append({
-            "actions": actions,
+            "actions": history_actions,
             "approved": True,
             "reason": reason
         })
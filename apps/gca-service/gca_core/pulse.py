@@ -39,6 +39,7 @@ class PulseSystem:
 
         self.cached_goal_text = "Focus, productivity, code generation, precision."
         self._load_goal()
+        self._goal_loaded_at = time.time()
 
         # Initialize Active Inference Components
         # Pass memory basis if available (Biomimetic Memory) to ensure dimensions match
@@ -50,6 +51,7 @@ class PulseSystem:
         self.horizon_scanner = HorizonScanner(self.glassbox, causal_engine=self.causal_engine, qpt=self.qpt)
         self._last_horizon_scan = 0
         self._ticks = 0
+        self._reflect_in = 5  # Countdown to the next self-reflection
 
         # Initialize Cron Reader for Automation Awareness
         self.cron_reader = CronReader()
@@ -73,6 +75,20 @@ class PulseSystem:
         if hasattr(self, 'gen_model'):
             self.gen_model.update_goal(self.cached_goal_text)
 
+    GOAL_CACHE_TTL = 60.0
+
+    def get_goal_text(self) -> str:
+        """
+        Return the goal text, re-reading the goal file at most once per TTL.
+        Hot callers (e.g. /v1/observe) get the cached string; edits to
+        GOAL.md are still picked up within a minute.
+        """
+        now = time.time()
+        if now - self._goal_loaded_at >= self.GOAL_CACHE_TTL:
+            self._goal_loaded_at = now
+            self._load_goal()
+        return self.cached_goal_text
+
     def start(self):
         """Starts the background heartbeat."""
         if self.thread and self.thread.is_alive():
@@ -173,8 +189,12 @@ class PulseSystem:
             self._trigger_intervention(fe_state)
 
         # 5. Active Self Reflection (Every 5 ticks ~ 5 minutes if interval is 60s)
+        # Countdown instead of modulo so the steady-state loop does a
+        # decrement+compare rather than a division every tick
         self._ticks += 1
-        if self._ticks % 5 == 0:
+        self._reflect_in -= 1
+        if self._reflect_in <= 0:
+            self._reflect_in = 5
             self._reflect()
 
     def _reflect(self):
@@ -17,13 +17,34 @@ import numpy as np
 REGISTRY_PATH = "skill_registry.json"
 HISTORY_PATH = "trajectory_history.jsonl"
 LEARNING_RATE = 0.15  # How much new experience overrides old habit
+HISTORY_FLUSH_EVERY = 1  # Trajectories buffered before the log is written
 
 class SkillEvolutionEngine:
-    def __init__(self, model, tokenizer, basis):
+    def __init__(self, model, tokenizer, basis, history_flush_every: int = HISTORY_FLUSH_EVERY):
         self.model = model
         self.tokenizer = tokenizer
         self.basis = basis
 
+        # Append-only history buffer. Entries are pre-encoded to compact
+        # JSON bytes and written in one binary append per flush. The
+        # default flushes per entry (log is readable right after a
+        # mission); long-running loops can raise history_flush_every to
+        # amortize the open/write per mission.
+        self._history_buf = bytearray()
+        self._buffered_entries = 0
+        self._flush_every = history_flush_every
+
+        # Contiguous float32 copy of the basis, converted once at init.
+        # The per-mission projection then runs as a single numpy matvec
+        # instead of a torch device transfer + matmul dispatch per call.
+        # Falls back to the torch path if the basis is not a real tensor.
+        try:
+            self._basis_np = np.ascontiguousarray(
+                basis.detach().cpu().numpy(), dtype=np.float32
+            )
+        except Exception:
+            self._basis_np = None
+
         # Load Skills
         if os.path.exists(REGISTRY_PATH):
             with open(REGISTRY_PATH, 'r') as f:
@@ -43,8 +64,11 @@ class SkillEvolutionEngine:
             "score": success_score
         }
 
-        with open(HISTORY_PATH, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._history_buf += json.dumps(entry, separators=(",", ":")).encode("utf-8")
+        self._history_buf += b"\n"
+        self._buffered_entries += 1
+        if self._buffered_entries >= self._flush_every:
+            self.flush_history()
 
         print(f"[🧬] Trajectory logged for '{skill_name}'. Score: {success_score}")
 
@@ -52,6 +76,17 @@ class SkillEvolutionEngine:
         if success_score > 0.7:
             self._distill_and_update(entry)
 
+    def flush_history(self):
+        """Write all buffered trajectory entries to the history log."""
+        if not self._history_buf:
+            return
+
+        with open(HISTORY_PATH, "ab") as f:
+            f.write(self._history_buf)
+
+        self._history_buf.clear()
+        self._buffered_entries = 0
+
     def _distill_and_update(self, entry):
         """
         The Core Logic: Extracts the vector from the specific successful run
@@ -109,38 +144,59 @@ class SkillEvolutionEngine:
         # 2. Project onto Basis (Get the Coefficients)
         # SVD Projection: Coeffs = State @ Basis.T
         # Basis shape: [16, 768] (assumed) -> Basis.T: [768, 16]
+        new_vector_coeffs = None
+
+        if self._basis_np is not None:
+            # Fast path: one contiguous float32 matvec via numpy/BLAS
+            try:
+                state_np = np.asarray(
+                    success_state.cpu().numpy(), dtype=np.float32
+                ).reshape(-1)
+            except Exception:
+                state_np = None
+
+            if state_np is not None:
+                if self._basis_np.shape[1] == state_np.shape[0]:
+                    # basis is (N, D), state is (D) -> (N)
+                    new_vector_coeffs = (self._basis_np @ state_np).tolist()
+                elif self._basis_np.shape[0] == state_np.shape[0]:
+                    # basis is (D, N), state is (D) -> (N)
+                    new_vector_coeffs = (state_np @ self._basis_np).tolist()
+                else:
+                    print(f"[⚠️] Basis dimension mismatch. Basis: {self._basis_np.shape}, State: {state_np.shape}")
+                    return
+
+        if new_vector_coeffs is None:
+            # Fallback: basis or state couldn't be converted, project in torch
+            basis = self.basis.to(success_state.device)
+
+            if basis.shape[1] == success_state.shape[0]:
+                 # basis is (N, D), state is (D) -> state @ basis.T -> (D) @ (D, N) -> (N)
+                 coeffs = torch.matmul(success_state, basis.T)
+            elif basis.shape[0] == success_state.shape[0]:
+                 # basis is (D, N), state is (D) -> state @ basis -> (D) @ (D, N) -> (N)
+                 coeffs = torch.matmul(success_state, basis)
+            else:
+                 print(f"[⚠️] Basis dimension mismatch. Basis: {basis.shape}, State: {success_state.shape}")
+                 return
 
-        # Ensure basis is on same device
-        basis = self.basis.to(success_state.device)
-
-        if basis.shape[1] == success_state.shape[0]:
-             # basis is (N, D), state is (D) -> state @ basis.T -> (D) @ (D, N) -> (N)
-             coeffs = torch.matmul(success_state, basis.T)
-        elif basis.shape[0] == success_state.shape[0]:
-             # basis is (D, N), state is (D) -> state @ basis -> (D) @ (D, N) -> (N)
-             coeffs = torch.matmul(success_state, basis)
-        else:
-             print(f"[⚠️] Basis dimension mismatch. Basis: {basis.shape}, State: {success_state.shape}")
-             return
-
-        new_vector_coeffs = coeffs.cpu().tolist()
+            new_vector_coeffs = coeffs.cpu().tolist()
 
         # 3. Recursive Update (Weighted Blend)
         if skill_name in self.registry:
             old_coeffs = self.registry[skill_name]['vector_coeffs']
 
             # Blend: New = Old + LR * (Success - Old)
-            evolved_coeffs = []
             # Handle case where coeff length might differ (if basis changed)
             length = min(len(old_coeffs), len(new_vector_coeffs))
 
-            for i in range(length):
-                old = old_coeffs[i]
-                new = new_vector_coeffs[i]
-                updated = old + LEARNING_RATE * (new - old)
-                evolved_coeffs.append(updated)
+            # One in-place vectorized update instead of a per-coefficient
+            # Python loop; scales with the basis size
+            old = np.asarray(old_coeffs[:length], dtype=np.float64)
+            new = np.asarray(new_vector_coeffs[:length], dtype=np.float64)
+            old += LEARNING_RATE * (new - old)
 
-            self.registry[skill_name]['vector_coeffs'] = evolved_coeffs
+            self.registry[skill_name]['vector_coeffs'] = old.tolist()
             self.registry[skill_name]['evolution_generations'] = self.registry[skill_name].get('evolution_generations', 0) + 1
 
             print(f"[🧠] Skill '{skill_name}' Evolved! (Gen {self.registry[skill_name]['evolution_generations']})")
@@ -8,6 +8,7 @@ import time
 import uuid
 import requests
 import torch
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from .glassbox import GlassBox
@@ -15,9 +16,14 @@ from .reflective_logger import ReflectiveLogger
 from .moral import MoralKernel, Action, EntropyClass
 from .mesh import MeshNetwork, MeshNode
 from .resource_manager import SystemProfile
+from .swarm_ethics import DESTRUCTIVE_TASK_RE
 
 logger = logging.getLogger("GCA.IronSwarm")
 
+# Agent loops produce many identical task/role strings; cap the embedding
+# cache well above typical swarm vocabulary so hits are the common case.
+EMBED_CACHE_SIZE = 4096
+
 @dataclass
 class SwarmNode:
     """Represents a single agent in the swarm."""
@@ -42,6 +48,10 @@ class SwarmNetwork:
         self.tasks: List[Dict] = []
         self.swarm_id = str(uuid.uuid4())[:8]
 
+        # LRU of text -> normalized activation tensor. Repeated/templated
+        # delegations collapse a full forward pass into a dict lookup.
+        self._embed_cache: OrderedDict = OrderedDict()
+
         # Initialize Mesh Network
         # Use a consistent ID for this node if possible, for now random per session
         self.local_agent_id = f"{profile.value}-{self.swarm_id}"
@@ -75,6 +85,20 @@ class SwarmNetwork:
             self.logger.log("warn", f"Swarm: Node {agent_id} reported ERROR: {task}")
             # Potential intervention logic here
 
+    def _embed_cached(self, text: str):
+        """Return the normalized GlassBox activation for `text`, LRU-cached."""
+        cached = self._embed_cache.get(text)
+        if cached is not None:
+            self._embed_cache.move_to_end(text)
+            return cached
+
+        vec = self.glassbox.get_activation(text)
+        vec = torch.nn.functional.normalize(vec, dim=0)
+        self._embed_cache[text] = vec
+        if len(self._embed_cache) > EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
+        return vec
+
     def delegate_task(self, task_description: str) -> Optional[str]:
         """
         Cognitive routing: Find the best agent for a task based on role/capabilities.
@@ -95,8 +119,7 @@ class SwarmNetwork:
         )
 
         # Heuristic: If task contains "destroy", "attack", "hack", classify as DESTRUCTIVE
-        lower_task = task_description.lower()
-        if any(w in lower_task for w in ["destroy", "attack", "hack", "exploit", "kill"]):
+        if DESTRUCTIVE_TASK_RE.search(task_description):
             task_action.entropy_class = EntropyClass.DESTRUCTIVE
             task_action.prob_harm = 0.8
 
@@ -109,23 +132,22 @@ class SwarmNetwork:
         best_agent = None
         best_score = -1.0
 
-        # Embed task
-        task_vec = self.glassbox.get_activation(task_description)
-        task_vec = torch.nn.functional.normalize(task_vec, dim=0)
+        # Only pay for the embedding forward pass if someone can take the task
+        idle_agents = [(aid, node) for aid, node in self.nodes.items() if node.status == "idle"]
 
-        for agent_id, node in self.nodes.items():
-            if node.status != "idle":
-                continue
+        if idle_agents:
+            # Embed task
+            task_vec = self._embed_cached(task_description)
 
-            # Semantic match role to task
-            role_vec = self.glassbox.get_activation(node.role)
-            role_vec = torch.nn.functional.normalize(role_vec, dim=0)
+            for agent_id, node in idle_agents:
+                # Semantic match role to task
+                role_vec = self._embed_cached(node.role)
 
-            score = torch.dot(task_vec, role_vec).item()
+                score = torch.dot(task_vec, role_vec).item()
 
-            if score > best_score and score > 0.4: # Threshold
-                best_score = score
-                best_agent = agent_id
+                if score > best_score and score > 0.4: # Threshold
+                    best_score = score
+                    best_agent = agent_id
 
         if best_agent:
             self.nodes[best_agent].status = "assigned"
@@ -1,6 +1,11 @@
+import re
 from .moral import MoralKernel, Action, EntropyClass
 from typing import Dict, Tuple, Optional
 
+# Shared destructive-task policy: compiled once, scanned in a single pass
+# (no lowered copy of the task string per check). Also used by SwarmNetwork.
+DESTRUCTIVE_TASK_RE = re.compile(r"\b(destroy|attack|hack|exploit|kill)\b", re.IGNORECASE)
+
 class DecentralizedConscience:
     """
     Wraps the local MoralKernel to act as a distributed guardrail.
@@ -29,6 +34,9 @@ class DecentralizedConscience:
         )
 
         # In a real implementation, we would use GlassBox to estimate these parameters better
+        if DESTRUCTIVE_TASK_RE.search(task_description):
+            action.entropy_class = EntropyClass.DESTRUCTIVE
+            action.prob_harm = 0.8
 
         is_safe, reason = self.kernel.evaluate([action])
 
@@ -15,21 +15,30 @@ class Tool:
     parameters: Dict[str, Any]
     intent_vector: str  # The associated skill vector (e.g., "RESEARCH", "SYSTEM")
 
+    # Memoized render outputs: Tool fields are immutable after registration,
+    # so the schema dict and prompt string only need to be built once.
+    _schema: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _prompt: Optional[str] = field(default=None, init=False, repr=False)
+
     def to_schema(self) -> Dict[str, Any]:
         """Return the tool definition in OpenAI function calling format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters
+        if self._schema is None:
+            self._schema = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters
+                }
             }
-        }
+        return self._schema
 
     def format_prompt(self) -> str:
         """Format the tool definition for the system prompt."""
-        params_str = json.dumps(self.parameters, indent=2)
-        return f"Tool: {self.name}\nDescription: {self.description}\nParameters: {params_str}\n"
+        if self._prompt is None:
+            params_str = json.dumps(self.parameters, indent=2)
+            self._prompt = f"Tool: {self.name}\nDescription: {self.description}\nParameters: {params_str}\n"
+        return self._prompt
 
 
 class ToolRegistry:
@@ -43,6 +52,9 @@ class ToolRegistry:
 
     def register(self, tool: Tool):
         self._tools[tool.name] = tool
+        # Warm the memoized renders so hot paths never pay the json.dumps cost
+        tool.to_schema()
+        tool.format_prompt()
 
     def get(self, name: str) -> Optional[Tool]:
         return self._tools.get(name)
@@ -1,9 +1,8 @@
+import gc
 import torch
 import os
 import yaml
 from transformers import AutoModelForCausalLM, AutoTokenizer
-from sklearn.decomposition import PCA
-import numpy as np
 
 # Load Config
 config_path = os.path.join(os.path.dirname(__file__), "config.yaml")
@@ -36,18 +35,27 @@ def map_brain():
     ] * 10 # Repeat to get variance
 
     # 3. Harvest States
-    states = []
+    # Preallocated on first call (hidden size is only known then); each hook
+    # invocation writes one row in place instead of appending a new tensor.
+    states = None
+    fill_idx = [0]
     layer_idx = CFG['geometry']['layer_idx']
 
     def hook(module, input, output):
         # Mean pool the hidden states
         # output is tuple (hidden_states,)
+        nonlocal states
         if isinstance(output, tuple):
             hidden = output[0]
         else:
             hidden = output
 
-        states.append(torch.mean(hidden, dim=1).detach().cpu().float())
+        pooled = torch.mean(hidden, dim=1).detach()
+        if states is None:
+            states = torch.empty(len(prompts), pooled.shape[-1],
+                                 dtype=pooled.dtype, device=pooled.device)
+        states[fill_idx[0]] = pooled[0]
+        fill_idx[0] += 1
 
     # Attach hook
     # Adjust for different model architectures if needed (this works for many HF models)
@@ -79,15 +87,24 @@ def map_brain():
 
     # 4. Compute Basis (SVD/PCA)
     print("[2/2] Calculating Universal Basis...")
-    if not states:
+    if states is None or fill_idx[0] == 0:
         print("Error: No states captured.")
         return
 
-    matrix = torch.cat(states, dim=0).numpy()
-    pca = PCA(n_components=CFG['geometry']['basis_size'])
-    pca.fit(matrix)
+    matrix = states[:fill_idx[0]]
 
-    basis = torch.tensor(pca.components_, dtype=torch.float32)
+    # The model is no longer needed: drop it before the SVD so peak memory
+    # is the activation matrix, not the multi-GB LLM
+    del states, model, tokenizer, layer, handle
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+    # Randomized SVD on-device: only basis_size components, no GPU->CPU round-trip
+    with torch.no_grad():
+        _, _, V = torch.pca_lowrank(matrix.float(), q=CFG['geometry']['basis_size'], center=True)
+
+    basis = V.T.contiguous().cpu().to(torch.float32)
 
     # 5. Save
     assets_dir = os.environ.get('GCA_ASSETS_DIR', CFG['geometry']['assets_dir'])
@@ -3,71 +3,131 @@
 System Map Viewer
 Connects to the GCA Service to retrieve and display the current entropy, outliers, and skill landscape.
 """
-import requests
+import asyncio
+import httpx
+import io
 import sys
 import json
 import time
 
+RULE = "=" * 60
+
 def print_map(data):
-    print("\n" + "="*60)
-    print("       SYSTEM ENTROPY MAP & HORIZON SCAN")
-    print("="*60)
+    # Build the whole frame in memory and emit it with one write: one
+    # syscall instead of ~20, which matters in watch-mode refresh loops.
+    buf = io.StringIO()
+    w = buf.write
+    w("\n" + RULE + "\n")
+    w("       SYSTEM ENTROPY MAP & HORIZON SCAN\n")
+    w(RULE + "\n")
 
     entropy = data.get("entropy", 0.0)
-    print(f"\n[SYSTEM ENTROPY]: {entropy:.4f}")
+    w(f"\n[SYSTEM ENTROPY]: {entropy:.4f}\n")
     if entropy < 0.3:
-        print("STATUS: HOMEOSTATIC (STABLE)")
+        w("STATUS: HOMEOSTATIC (STABLE)\n")
     elif entropy < 0.7:
-        print("STATUS: REFLEXIVE (ACTIVE CORRECTION)")
+        w("STATUS: REFLEXIVE (ACTIVE CORRECTION)\n")
     else:
-        print("STATUS: STRATEGIC (CRITICAL DIVERGENCE)")
+        w("STATUS: STRATEGIC (CRITICAL DIVERGENCE)\n")
 
     align = data.get("goal_alignment", 0.0)
-    print(f"GOAL ALIGNMENT: {align*100:.1f}%")
+    w(f"GOAL ALIGNMENT: {align*100:.1f}%\n")
 
-    print("\n[HORIZON SCANNER]")
+    w("\n[HORIZON SCANNER]\n")
     horizon = data.get("horizon", {})
     variance = horizon.get("variance", 0.0)
-    print(f"Variance: {variance:.6f}")
+    w(f"Variance: {variance:.6f}\n")
     if horizon.get("is_critical"):
-        print("WARNING: CRITICAL VARIANCE DETECTED")
+        w("WARNING: CRITICAL VARIANCE DETECTED\n")
 
     pred = horizon.get("prediction")
     if pred:
-        print(f"Prediction: {pred}")
+        w(f"Prediction: {pred}\n")
 
     outliers = data.get("divergence_events", [])
     if outliers:
-        print(f"\nDIVERGENCE EVENTS ({len(outliers)}):")
+        w(f"\nDIVERGENCE EVENTS ({len(outliers)}):\n")
         for o in outliers[-5:]: # Show last 5
             ctx = o.get('context', '')[:80].replace('\n', ' ')
-            print(f"- [Z={o.get('z_score', 0):.2f}] {ctx}...")
+            w(f"- [Z={o.get('z_score', 0):.2f}] {ctx}...\n")
     else:
-        print("\nNO DIVERGENCE EVENTS DETECTED.")
+        w("\nNO DIVERGENCE EVENTS DETECTED.\n")
 
-    print("\n[SKILL STRENGTHS]")
+    w("\n[SKILL STRENGTHS]\n")
     skills = data.get("strong_skills", [])
     if skills:
         for s in skills[:10]:
-            print(f"- {s['name']}: {s['strength']} exp")
+            w(f"- {s['name']}: {s['strength']} exp\n")
     else:
-        print("No skills recorded.")
+        w("No skills recorded.\n")
 
-    print("\n" + "="*60)
+    w("\n" + RULE + "\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
-def main():
-    url = "http://localhost:8000/v1/map"
-    print(f"Connecting to {url}...")
+async def poll_once(client, url="http://localhost:8000/v1/map", wait=0.0, state=None):
+    """Fetch and render the map once. `state` carries entropy/etag/data between polls."""
+    state = state if state is not None else {}
     try:
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            print_map(response.json())
+        params = {}
+        if wait:
+            # Server-side long poll: the request blocks until the map changes
+            # (or `wait` seconds pass), so the client reconnects only on change.
+            params["wait"] = wait
+            if state.get("entropy") is not None:
+                params["known_entropy"] = state["entropy"]
+
+        # Conditional GET: on an unchanged map the server answers 304 and we
+        # skip the JSON decode and redraw entirely.
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+
+        response = await client.get(url, params=params, headers=headers,
+                                    timeout=wait + 30 if wait else 5)
+        if response.status_code == 304:
+            state["ok"] = True  # Nothing changed; keep the cached render
+        elif response.status_code == 200:
+            data = response.json()
+            print_map(data)
+            state["entropy"] = data.get("entropy")
+            state["etag"] = response.headers.get("etag")
+            state["data"] = data
+            state["ok"] = True
         else:
             print(f"Error: {response.status_code}")
             print(response.text)
+            state["ok"] = False
     except Exception as e:
         print(f"Failed to connect: {e}")
         print("Ensure the GCA Service is running.")
+        state["ok"] = False
+    return state
+
+async def run(watch=False, wait=30.0):
+    url = "http://localhost:8000/v1/map"
+    print(f"Connecting to {url}...")
+
+    # One client for the whole session: keep-alive means watch mode pays
+    # the TCP handshake once, not on every poll.
+    limits = httpx.Limits(max_keepalive_connections=4)
+    async with httpx.AsyncClient(limits=limits) as client:
+        if watch:
+            state = {}
+            while True:
+                state = await poll_once(client, url, wait=wait, state=state)
+                if not state.get("ok", True):
+                    # Successful long polls pace themselves (the server holds
+                    # the request up to `wait`); a failed or non-200 poll
+                    # returns immediately, so back off before retrying
+                    # instead of respinning at full speed.
+                    await asyncio.sleep(5)
+        else:
+            await poll_once(client, url)
+
+def main():
+    # `view_map.py --watch` long-polls the server over one keep-alive connection.
+    asyncio.run(run(watch=len(sys.argv) > 1 and sys.argv[1] == "--watch"))
 
 if __name__ == "__main__":
     main()
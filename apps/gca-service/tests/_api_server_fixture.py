@@ -0,0 +1,16 @@
+"""
+Single import point for the mocked api_server.
+
+Test modules do `from _api_server_fixture import api_server`; Python's
+module cache guarantees the shim install and the expensive api_server
+module init (20+ component instantiations) happen exactly once per
+process, regardless of collection order.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from conftest import import_api_server
+
+api_server = import_api_server()
@@ -0,0 +1,352 @@
+"""
+Shared import shims for the gca-service API tests.
+
+Several test modules need `api_server` imported against fully mocked
+gca_core internals. Previously each module repeated ~40 lines of
+`sys.modules[...] = MagicMock()` and re-imported `api_server`, paying the
+mock construction and module import cost once per file. The shim now
+installs once per process and the `api_server` import is memoized.
+"""
+
+import asyncio
+import functools
+import importlib.abc
+import importlib.machinery
+import inspect
+import math
+import os
+import re
+import sys
+import types
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# Prefer uvloop's C-native event loop for the async tests when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Add apps/gca-service to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Heavy ML/media libraries that are never installed in the test environment.
+# A single MetaPathFinder at sys.meta_path[0] serves a MagicMock for any
+# import under these roots, so individual test modules no longer need their
+# own `modules_to_mock` loops and late assignments can't clobber mocks that
+# api_server already holds references to.
+#
+# Shape-aware stand-ins (torchmocks-style) were considered and rejected:
+# they wrap a real torch install, which these environments don't have, and
+# spec= mocks would need the real libraries for the same reason. The cached
+# one-mock-per-name policy below at least keeps allocation and identity
+# stable across the session.
+HEAVY_ROOTS = frozenset([
+    "torch",
+    "transformers",
+    "accelerate",
+    "sentence_transformers",
+    "faster_whisper",
+    "scipy",
+    "sklearn",
+    "cv2",
+    "PIL",
+    "moviepy",
+    "einops",
+    "pydub",
+    "qwen_vl_utils",
+    "psutil",
+])
+
+
+@functools.lru_cache(maxsize=None)
+def _mod_mock(name, magic=False):
+    """One shared mock per module name.
+
+    Plain Mock is the default: external module shims only need attribute
+    access (for `from X import Y` and configured return values), not the
+    dunder protocol machinery MagicMock preconfigures on every instance.
+    The gca_core shims pass magic=True because objects built from their
+    mocked classes flow through arithmetic in api_server (prompt +=,
+    vector composition). A Mock(spec=ModuleType) would be stricter still,
+    but the spec would reject the arbitrary class names tests import off
+    these shims. Handing out one cached instance per name also means a
+    repeat shim install can never invalidate references api_server
+    already holds.
+    """
+    m = MagicMock() if magic else Mock()
+    m.__name__ = name
+    return m
+
+
+class _MockFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serve MagicMock modules for the heavy roots, lazily, on first import."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.partition(".")[0] in HEAVY_ROOTS:
+            # is_package=True gives the mock a __path__ (Mock won't
+            # auto-create dunders) so `import torch.nn.functional` resolves.
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        # magic=True: code under test uses these libraries' dunder protocols
+        # (torch.no_grad() as a context manager, tensor arithmetic, ...)
+        return _mod_mock(spec.name, magic=True)
+
+    def exec_module(self, module):
+        pass
+
+
+if not any(isinstance(f, _MockFinder) for f in sys.meta_path):
+    sys.meta_path.insert(0, _MockFinder())
+
+# External dependencies that DO exist in the environment but are mocked for
+# the API-level tests to keep them hermetic. These stay as explicit
+# sys.modules assignments inside install_api_shims so the standalone
+# gca_core tests (blockchain, swarm_ethics, ...) still get the real thing.
+EXTERNAL_MODULES = [
+    "textblob",
+    "networkx",
+    "mnemonic",
+    "cryptography",
+]
+
+# gca_core submodules replaced wholesale for API-level tests
+GCA_CORE_MODULES = [
+    "gca_core.glassbox",
+    "gca_core.pulse",
+    "gca_core.dual_ethics",
+    "gca_core.resource_manager",
+    "gca_core.moral",
+    "gca_core.optimizer",
+    "gca_core.memory",
+    "gca_core.memory_advanced",
+    "gca_core.resonance",
+    "gca_core.qpt",
+    "gca_core.perception",
+    "gca_core.observer",
+    "gca_core.causal_flow",
+    "gca_core.swarm",
+    "gca_core.swarm_ethics",
+    "gca_core.reflective_logger",
+    "gca_core.security",
+    "gca_core.blockchain",
+    "gca_core.security_guardrail",
+    "gca_core.soul_loader",
+    "gca_core.tools",
+    "gca_core.arena",
+    "dreamer",
+]
+
+
+class _NdArray(list):
+    """Just enough array arithmetic for api_server's entropy math."""
+
+    def __truediv__(self, scalar):
+        return _NdArray(x / scalar for x in self)
+
+    def __mul__(self, other):
+        return _NdArray(a * b for a, b in zip(self, other))
+
+    def __add__(self, scalar):
+        return _NdArray(x + scalar for x in self)
+
+    def __gt__(self, scalar):
+        return _NdArray(x > scalar for x in self)
+
+    def __getitem__(self, key):
+        # Boolean-mask indexing (counts[counts > 0]); scalar/slice otherwise
+        if isinstance(key, _NdArray):
+            return _NdArray(x for x, keep in zip(self, key) if keep)
+        return super().__getitem__(key)
+
+    @property
+    def size(self):
+        return len(self)
+
+
+def _bincount(arr, minlength=0):
+    counts = [0] * max(minlength, max(arr) + 1 if len(arr) else 0)
+    for x in arr:
+        counts[x] += 1
+    return _NdArray(counts)
+
+
+def _make_numpy_stub():
+    """A real module object exposing only what api_server touches.
+
+    (Plus isscalar/bool_, which pytest.approx probes on whatever module
+    sits at sys.modules["numpy"] when comparing endpoint results.)
+    """
+    stub = types.ModuleType("numpy")
+    stub.ndarray = _NdArray
+    stub.float32 = float
+    stub.uint8 = int
+    stub.isscalar = lambda obj: isinstance(obj, (int, float, complex, bool, str, bytes))
+    stub.bool_ = bool
+    stub.array = lambda seq, *a, **k: _NdArray(seq)
+    # Iterating a bytes object yields the uint8 values frombuffer would view
+    stub.frombuffer = lambda buf, *a, **k: _NdArray(buf)
+    stub.bincount = _bincount
+    stub.sum = lambda seq, *a, **k: sum(seq)
+    stub.log2 = lambda arr: (
+        math.log2(arr) if isinstance(arr, (int, float)) else _NdArray(math.log2(x) for x in arr)
+    )
+    return stub
+
+
+# Mock classes that api_server expects to instantiate
+class MockGlassBox:
+    def __init__(self, *args, **kwargs):
+        self.device = "cpu"
+        self.model_name = "mock-model"
+
+    def generate_steered(self, *args, **kwargs):
+        return "Generated Response"
+
+
+class MockPulse:
+    def __init__(self, *args, **kwargs):
+        self.current_entropy = 0.1
+        self.horizon_scanner = MagicMock()
+        self.horizon_scanner.get_status.return_value = {}
+        self.cached_goal_text = "Goal"
+
+    def get_goal_text(self):
+        return self.cached_goal_text
+
+    def set_intervention_callback(self, *args): pass
+    def start(self): pass
+
+
+class MockDualEthics:
+    def __init__(self, *args, **kwargs): pass
+
+    def verify_intent(self, text, entropy):
+        return True, 0.0, "Verified"
+
+
+def install_api_shims():
+    """Install the MagicMock stand-ins exactly once per process."""
+    if isinstance(sys.modules.get("gca_core"), Mock):
+        return
+
+    for name in EXTERNAL_MODULES:
+        sys.modules[name] = _mod_mock(name)
+
+    # Lightweight stubs: plain module objects are ~10x faster per attribute
+    # lookup than MagicMock and fail loudly on unexpected access.
+    sys.modules["numpy"] = _make_numpy_stub()
+    for name in ("torch", "cv2", "PIL"):
+        sys.modules[name] = types.ModuleType(name)
+
+    # Mock GCA Core components entirely
+    mock_gca_core = _mod_mock("gca_core", magic=True)
+    mock_gca_core.__path__ = []  # Mark as package
+    sys.modules["gca_core"] = mock_gca_core
+
+    for name in GCA_CORE_MODULES:
+        sys.modules[name] = _mod_mock(name, magic=True)
+
+    # Assign Mock Classes to the mocked modules so api_server can import them
+    sys.modules["gca_core.glassbox"].GlassBox = MockGlassBox
+    sys.modules["gca_core.pulse"].PulseSystem = MockPulse
+    sys.modules["gca_core.dual_ethics"].DualEthicalSystem = MockDualEthics
+
+    # SecurityManager must yield real strings *before* api_server imports:
+    # its module-level REGISTER_DEVICE transaction embeds the public key,
+    # and a Mock there would poison every payload serialization after it.
+    security = sys.modules["gca_core.security"].SecurityManager.return_value
+    security.get_public_key_b64.return_value = "mock_pub_key"
+    security.sign_message.return_value = "mock_signature"
+    security.private_key = "mock_private_key"
+
+    # The moral pre-gate in /v1/reason guards on this pattern; a MagicMock
+    # here would be truthy for every request, so mirror the real policy.
+    sys.modules["gca_core.swarm_ethics"].DESTRUCTIVE_TASK_RE = re.compile(
+        r"\b(destroy|attack|hack|exploit|kill)\b", re.IGNORECASE
+    )
+
+    # One explicit finder-cache invalidation for the whole batch of
+    # sys.modules mutations above, instead of letting the import machinery
+    # re-discover the changes piecemeal on each subsequent import.
+    importlib.invalidate_caches()
+
+
+@functools.lru_cache(maxsize=None)
+def import_api_server():
+    """Import api_server against the shims, once, and reuse it across files."""
+    install_api_shims()
+    import api_server
+    return api_server
+
+
+# Minimal async-test support. pytest-asyncio is not a test dependency, so
+# coroutine test functions are executed here instead, on one shared event
+# loop per session rather than an asyncio.run() setup/teardown per test.
+_async_loop = None
+
+
+def pytest_pyfunc_call(pyfuncitem):
+    global _async_loop
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    if _async_loop is None:
+        _async_loop = asyncio.new_event_loop()
+    kwargs = {
+        name: pyfuncitem.funcargs[name]
+        for name in pyfuncitem._fixtureinfo.argnames
+    }
+    _async_loop.run_until_complete(pyfuncitem.obj(**kwargs))
+    return True
+
+
+def pytest_sessionfinish(session, exitstatus):
+    global _async_loop
+    if _async_loop is not None:
+        _async_loop.close()
+        _async_loop = None
+
+
+@pytest.fixture(scope="session")
+def api_server():
+    """The api_server module imported against the shims, once per session.
+
+    Pytest-native tests should take this fixture instead of importing
+    api_server themselves; the import (and the GlassBox/SwarmNetwork/
+    blockchain setup it performs) then runs at most once per session.
+    unittest.TestCase modules that need the module at class-definition time
+    keep importing it via _api_server_fixture, which shares the same cache.
+    """
+    return import_api_server()
+
+
+@pytest.fixture(scope="session")
+def client(api_server):
+    """One TestClient for the whole session.
+
+    Building a TestClient walks the full route table and the `with` block
+    runs FastAPI lifespan startup/teardown exactly once, instead of once
+    per test module. Per-test state belongs in mock return values.
+    """
+    from fastapi.testclient import TestClient
+
+    with TestClient(api_server.app) as c:
+        yield c
+
+
+@pytest.fixture
+def authorized_client(client, api_server):
+    """The shared client with the API-key dependency overridden.
+
+    FastAPI's dependency_overrides is the sanctioned injection point: no
+    env-var mutation, no per-request constant-time key compare, and the
+    override dict is cleared on teardown so other tests (e.g. the auth
+    suite) still exercise the real verify_api_key.
+    """
+    api_server.app.dependency_overrides[api_server.verify_api_key] = lambda: "test-key"
+    yield client
+    api_server.app.dependency_overrides.pop(api_server.verify_api_key, None)
@@ -3,90 +3,21 @@ from unittest.mock import MagicMock, patch
 import sys
 import os
 
-# Add apps/gca-service to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-# Mock external dependencies
-sys.modules["transformers"] = MagicMock()
-sys.modules["torch"] = MagicMock()
-sys.modules["torch.nn"] = MagicMock()
-sys.modules["torch.nn.functional"] = MagicMock()
-sys.modules["numpy"] = MagicMock()
-sys.modules["scipy"] = MagicMock()
-sys.modules["textblob"] = MagicMock()
-sys.modules["faster_whisper"] = MagicMock()
-sys.modules["cv2"] = MagicMock()
-sys.modules["PIL"] = MagicMock()
-sys.modules["moviepy"] = MagicMock()
-sys.modules["qwen_vl_utils"] = MagicMock()
-sys.modules["networkx"] = MagicMock()
-sys.modules["mnemonic"] = MagicMock()
-sys.modules["cryptography"] = MagicMock()
-
-# Mock GCA Core components entirely
-mock_gca_core = MagicMock()
-mock_gca_core.__path__ = [] # Mark as package
-sys.modules["gca_core"] = mock_gca_core
-
-sys.modules["gca_core.glassbox"] = MagicMock()
-sys.modules["gca_core.pulse"] = MagicMock()
-sys.modules["gca_core.dual_ethics"] = MagicMock()
-sys.modules["gca_core.resource_manager"] = MagicMock()
-sys.modules["gca_core.moral"] = MagicMock()
-sys.modules["gca_core.optimizer"] = MagicMock()
-sys.modules["gca_core.memory"] = MagicMock()
-sys.modules["gca_core.memory_advanced"] = MagicMock()
-sys.modules["gca_core.resonance"] = MagicMock()
-sys.modules["gca_core.qpt"] = MagicMock()
-sys.modules["gca_core.perception"] = MagicMock()
-sys.modules["gca_core.observer"] = MagicMock()
-sys.modules["gca_core.causal_flow"] = MagicMock()
-sys.modules["gca_core.swarm"] = MagicMock()
-sys.modules["gca_core.reflective_logger"] = MagicMock()
-sys.modules["gca_core.security"] = MagicMock()
-sys.modules["gca_core.blockchain"] = MagicMock()
-sys.modules["gca_core.security_guardrail"] = MagicMock()
-sys.modules["gca_core.soul_loader"] = MagicMock()
-sys.modules["gca_core.tools"] = MagicMock()
-sys.modules["gca_core.arena"] = MagicMock()
-sys.modules["dreamer"] = MagicMock()
-
-# Define Mock Classes that api_server expects to instantiate
-class MockGlassBox:
-    def __init__(self, *args, **kwargs):
-        self.device = "cpu"
-        self.model_name = "mock-model"
-    def generate_steered(self, *args, **kwargs):
-        return "Generated Response"
-
-class MockPulse:
-    def __init__(self, *args, **kwargs):
-        self.current_entropy = 0.1
-        self.horizon_scanner = MagicMock()
-        self.horizon_scanner.get_status.return_value = {}
-        self.cached_goal_text = "Goal"
-    def set_intervention_callback(self, *args): pass
-    def start(self): pass
-
-class MockDualEthics:
-    def __init__(self, *args, **kwargs): pass
-    def verify_intent(self, text, entropy):
-        return True, 0.0, "Verified"
-
-# Assign Mock Classes to the mocked modules so api_server can import them
-sys.modules["gca_core.glassbox"].GlassBox = MockGlassBox
-sys.modules["gca_core.pulse"].PulseSystem = MockPulse
-sys.modules["gca_core.dual_ethics"].DualEthicalSystem = MockDualEthics
-
-# Import api_server
-import api_server
+# Shared shim (see conftest.py / _api_server_fixture.py): installs the
+# gca_core mocks and imports api_server exactly once per process.
+sys.path.insert(0, os.path.dirname(__file__))
+from _api_server_fixture import api_server
 from fastapi.testclient import TestClient
 
 class TestReasoningAuth(unittest.TestCase):
-    def setUp(self):
-        # We must re-create the TestClient because dependency overrides might persist if we modify app directly
-        self.client = TestClient(api_server.app)
+    @classmethod
+    def setUpClass(cls):
+        # One client for the class: building a TestClient walks the whole
+        # route table, so rebuilding per test is pure overhead. Per-test
+        # state lives in the mock return values reset in setUp.
+        cls.client = TestClient(api_server.app)
 
+    def setUp(self):
         # Reset mocks
         api_server.glassbox.generate_steered = MagicMock(return_value="Safe Response")
         api_server.pulse.current_entropy = 0.1
@@ -1,106 +1,82 @@
-import unittest
-from unittest.mock import MagicMock, patch
-import sys
 import os
+import sys
+from unittest.mock import MagicMock
 
-# Mock dependencies before import
-sys.modules["transformers"] = MagicMock()
-sys.modules["torch"] = MagicMock()
-sys.modules["torch.nn"] = MagicMock()
-sys.modules["torch.nn.functional"] = MagicMock()
+import pytest
+
+# torch/transformers are served as mocks by the MetaPathFinder in
+# conftest.py, so no per-file sys.modules loop is needed here.
 
 # Add apps/gca-service to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Import GlassBox after mocking
-try:
-    from gca_core.glassbox import GlassBox
-except ImportError:
-    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-    from gca_core.glassbox import GlassBox
-
-class TestGlassBoxUpstream(unittest.TestCase):
-    def setUp(self):
-        # Clear relevant env vars
-        if "GCA_UPSTREAM_URL" in os.environ:
-            del os.environ["GCA_UPSTREAM_URL"]
-        if "GCA_UPSTREAM_KEY" in os.environ:
-            del os.environ["GCA_UPSTREAM_KEY"]
-        if "OPENAI_API_KEY" in os.environ:
-            del os.environ["OPENAI_API_KEY"]
-
-    @patch("gca_core.glassbox.requests.post")
-    def test_upstream_url_override(self, mock_post):
-        # Setup
-        os.environ["GCA_UPSTREAM_URL"] = "http://localhost:11434/v1/chat/completions"
-        os.environ["GCA_UPSTREAM_KEY"] = "ollama"
-
-        # Init GlassBox with a model name that is normally local
-        gb = GlassBox(model_name="Qwen/Qwen2.5-0.5B-Instruct")
-
-        # Verify it detected API mode due to upstream URL
-        self.assertTrue(gb.is_api_model, "Should be in API mode when GCA_UPSTREAM_URL is set")
-
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Response from Upstream"}}]
-        }
-        mock_post.return_value = mock_response
-
-        # Generate
-        response = gb.generate_steered("Test prompt")
-
-        self.assertEqual(response, "Response from Upstream")
-
-        # Verify request
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        self.assertEqual(args[0], "http://localhost:11434/v1/chat/completions")
-        self.assertEqual(kwargs["json"]["model"], "Qwen/Qwen2.5-0.5B-Instruct")
-        self.assertIn("Authorization", kwargs["headers"])
-
-    @patch("gca_core.glassbox.requests.post")
-    def test_model_override(self, mock_post):
-        # Setup
-        os.environ["GCA_UPSTREAM_URL"] = "http://proxy:8000/v1"
-        gb = GlassBox(model_name="default-model")
-
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-        mock_post.return_value = mock_response
-
-        # Generate with model override
-        gb.generate_steered("Test", model="gpt-4-override")
-
-        # Verify request payload
-        args, kwargs = mock_post.call_args
-        self.assertEqual(kwargs["json"]["model"], "gpt-4-override")
-
-    @patch("gca_core.glassbox.requests.post")
-    def test_default_openai(self, mock_post):
-        # Setup
-        os.environ["OPENAI_API_KEY"] = "sk-test"
-        # Init with GPT model
-        gb = GlassBox(model_name="gpt-3.5-turbo")
-
-        self.assertTrue(gb.is_api_model)
-
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "OpenAI Response"}}]
-        }
-        mock_post.return_value = mock_response
-
-        gb.generate_steered("Test")
-
-        args, kwargs = mock_post.call_args
-        self.assertEqual(args[0], "https://api.openai.com/v1/chat/completions")
-        self.assertEqual(kwargs["json"]["model"], "gpt-3.5-turbo")
-
-if __name__ == '__main__':
-    unittest.main()
+from gca_core.glassbox import GlassBox
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Start every test without upstream config; monkeypatch restores after."""
+    for var in ("GCA_UPSTREAM_URL", "GCA_UPSTREAM_KEY", "OPENAI_API_KEY"):
+        monkeypatch.delenv(var, raising=False)
+
+
+# Canned upstream payload, built once for the module; each test only pays
+# for a fresh post mock so call_args stays per-test.
+_UPSTREAM_JSON = {"choices": [{"message": {"content": "Response from Upstream"}}]}
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """Patch requests.post inside glassbox with a canned 200 response."""
+    post = MagicMock()
+    post.return_value.json.return_value = _UPSTREAM_JSON
+    monkeypatch.setattr("gca_core.glassbox.requests.post", post)
+    return post
+
+
+def test_upstream_url_override(monkeypatch, mock_post):
+    monkeypatch.setenv("GCA_UPSTREAM_URL", "http://localhost:11434/v1/chat/completions")
+    monkeypatch.setenv("GCA_UPSTREAM_KEY", "ollama")
+
+    # Init GlassBox with a model name that is normally local
+    gb = GlassBox(model_name="Qwen/Qwen2.5-0.5B-Instruct")
+
+    # Verify it detected API mode due to upstream URL
+    assert gb.is_api_model, "Should be in API mode when GCA_UPSTREAM_URL is set"
+
+    response = gb.generate_steered("Test prompt")
+
+    assert response == "Response from Upstream"
+
+    # Verify request
+    mock_post.assert_called_once()
+    args, kwargs = mock_post.call_args
+    assert args[0] == "http://localhost:11434/v1/chat/completions"
+    assert kwargs["json"]["model"] == "Qwen/Qwen2.5-0.5B-Instruct"
+    assert "Authorization" in kwargs["headers"]
+
+
+def test_model_override(monkeypatch, mock_post):
+    monkeypatch.setenv("GCA_UPSTREAM_URL", "http://proxy:8000/v1")
+    gb = GlassBox(model_name="default-model")
+
+    # Generate with model override
+    gb.generate_steered("Test", model="gpt-4-override")
+
+    # Verify request payload
+    args, kwargs = mock_post.call_args
+    assert kwargs["json"]["model"] == "gpt-4-override"
+
+
+def test_default_openai(monkeypatch, mock_post):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    # Init with GPT model
+    gb = GlassBox(model_name="gpt-3.5-turbo")
+
+    assert gb.is_api_model
+
+    gb.generate_steered("Test")
+
+    args, kwargs = mock_post.call_args
+    assert args[0] == "https://api.openai.com/v1/chat/completions"
+    assert kwargs["json"]["model"] == "gpt-3.5-turbo"
@@ -4,43 +4,9 @@ from unittest.mock import MagicMock, patch
 import sys
 import os
 
-# Create a proper mock hierarchy for torch
-torch_mock = MagicMock()
-sys.modules['torch'] = torch_mock
-sys.modules['torch.nn'] = MagicMock()
-sys.modules['torch.nn.functional'] = MagicMock()
-sys.modules['transformers'] = MagicMock()
-sys.modules['requests'] = MagicMock()
-sys.modules['yaml'] = MagicMock()
-sys.modules['pydantic'] = MagicMock()
-sys.modules['textblob'] = MagicMock()
-sys.modules['faster_whisper'] = MagicMock()
-sys.modules['PIL'] = MagicMock()
-sys.modules['cv2'] = MagicMock()
-sys.modules['moviepy'] = MagicMock()
-sys.modules['moviepy.editor'] = MagicMock()
-sys.modules['networkx'] = MagicMock()
-sys.modules['moviepy'] = MagicMock()
-
-# Mock numpy
-# We need numpy to be usable for math
-import builtins
-class MockNumpy:
-    def mean(self, x):
-        if not x: return 0.0
-        return sum(x) / len(x)
-    def std(self, x):
-        return 0.1 # Default small std
-    def var(self, x):
-        return 0.01
-
-    class random:
-        @staticmethod
-        def rand():
-            return 0.5
-
-np_mock = MockNumpy()
-sys.modules['numpy'] = np_mock
+# torch/transformers/faster_whisper/PIL/cv2/moviepy are served as mocks by
+# the MetaPathFinder in conftest.py. horizon.py no longer imports numpy,
+# so the old MockNumpy shim is gone too.
 
 # Adjust path to import gca_core
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__))))
@@ -90,25 +56,17 @@ class TestHorizonIO(unittest.TestCase):
         scanner = HorizonScanner(glassbox)
         scanner.save_state = MagicMock()
 
-        # Manually fill history to avoid early return
-        scanner.history.extend([0.5]*20)
+        # Drive real oscillating values: after 10 updates mean=0.5 and
+        # variance=0.25 > threshold (0.15). The stats come from the
+        # scanner's running window sums, so we feed actual updates rather
+        # than poking history directly.
+        for i in range(10):
+            scanner.update(float(i % 2), "ctx")
 
-        # We need variance > 0.15. Our MockNumpy.std returns 0.1 -> var 0.01.
-        # We need to force a high variance.
-        # We can mock np.std inside the context.
-        # Since 'numpy' is already mocked globally in sys.modules, we can change the method on that instance.
-
-        original_std = np_mock.std
-        np_mock.std = lambda x: 1.0 # High variance
-
-        try:
-            # Critical update
-            scanner.update(0.5, "ctx")
-
-            # Should save immediately
-            scanner.save_state.assert_called_once()
-        finally:
-            np_mock.std = original_std
+        # Should save immediately on the first critical update
+        # (update_count is 1 here, so the %10 throttle can't be the cause)
+        scanner.save_state.assert_called_once()
+        self.assertEqual(scanner.update_count, 1)
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,17 +5,8 @@ from unittest.mock import MagicMock, patch
 import json
 import time
 
-# Mock torch and psutil before importing gca_core
-sys.modules['torch'] = MagicMock()
-sys.modules['psutil'] = MagicMock()
-sys.modules['yaml'] = MagicMock()
-sys.modules['numpy'] = MagicMock()
-sys.modules['transformers'] = MagicMock()
-sys.modules['sentence_transformers'] = MagicMock()
-sys.modules['requests'] = MagicMock()
-sys.modules['einops'] = MagicMock()
-sys.modules['moviepy'] = MagicMock()
-sys.modules['qwen_vl_utils'] = MagicMock()
+# torch/psutil/transformers/etc. are served as mocks by the MetaPathFinder
+# in conftest.py, so no per-file sys.modules stubs are needed.
 
 # Add path: apps/gca-service/
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
@@ -4,66 +4,42 @@ from unittest.mock import MagicMock
 import sys
 import os
 
-# Create a proper mock hierarchy for torch
-torch_mock = MagicMock()
-sys.modules['torch'] = torch_mock
-sys.modules['torch.nn'] = MagicMock()
-sys.modules['torch.nn.functional'] = MagicMock()
-sys.modules['transformers'] = MagicMock()
-sys.modules['requests'] = MagicMock()
-sys.modules['yaml'] = MagicMock()
-sys.modules['pydantic'] = MagicMock()
-sys.modules['numpy'] = MagicMock()
-sys.modules['textblob'] = MagicMock()
-sys.modules['faster_whisper'] = MagicMock()
-sys.modules['PIL'] = MagicMock()
-sys.modules['cv2'] = MagicMock()
-sys.modules['moviepy'] = MagicMock()
-sys.modules['moviepy.editor'] = MagicMock()
-sys.modules['networkx'] = MagicMock()
+# Heavy ML/media libraries are served as mocks by the MetaPathFinder in
+# conftest.py; everything else this import chain touches is real.
 
 # Adjust path to import gca_core
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__))))
 
 from gca_core.optimizer import GCAOptimizer
 
+# find_similar returns list of (skill_name, score). A plain lambda keeps
+# route_intent calls off MagicMock's call-recording machinery.
+_FIXED_SIMILAR = [("MOCK_SKILL", 0.9)]
+
 class TestOptimizerCache(unittest.TestCase):
     def test_cache_limit(self):
         glassbox = MagicMock()
         memory = MagicMock()
-
-        # Mock memory find_similar to always return something
-        # find_similar returns list of (skill_name, score)
-        memory.find_similar.return_value = [("MOCK_SKILL", 0.9)]
+        memory.find_similar = lambda activation, top_k=1: _FIXED_SIMILAR
 
         optimizer = GCAOptimizer(glassbox, memory)
 
         # Ensure cache starts empty
         self.assertEqual(len(optimizer.intent_cache), 0)
 
-        limit = 1000
+        limit = optimizer.CACHE_LIMIT
         extra = 50
 
-        for i in range(limit + extra):
-            # Unique input each time
-            input_text = f"intent_{i}"
-
-            # Call route_intent
-            optimizer.route_intent(input_text)
+        # Batched fill: one tight insertion loop instead of 1050 full
+        # route_intent round-trips through the MagicMock memory.
+        optimizer._prime_cache(f"intent_{i}" for i in range(limit + extra))
 
-            # Check size periodically
-            current_size = len(optimizer.intent_cache)
-            if i >= limit:
-                # With logic: if > 1000 delete one, then add new.
-                # So max is 1001?
-                # Let's trace:
-                # 1000 items. Insert 1001st. Before insert, len=1000. Not > 1000. Insert. len=1001.
-                # Next call. len=1001. > 1000. Delete one. len=1000. Insert. len=1001.
-                # So size should be oscillating between 1000 and 1001.
-                self.assertLessEqual(current_size, 1001)
-                self.assertGreaterEqual(current_size, 1000)
+        # Cache must be trimmed back to the limit
+        self.assertEqual(len(optimizer.intent_cache), limit)
 
-        # print(f"Cache size after {limit+extra} inserts: {len(optimizer.intent_cache)}")
+        # A real routed insert on a full cache must also respect the limit
+        optimizer.route_intent(f"intent_{limit + extra}")
+        self.assertLessEqual(len(optimizer.intent_cache), limit)
 
         # Check specific eviction
         # intent_0 should be gone (oldest)
@@ -74,14 +50,14 @@ class TestOptimizerCache(unittest.TestCase):
     def test_lru_behavior(self):
         glassbox = MagicMock()
         memory = MagicMock()
-        memory.find_similar.return_value = [("MOCK_SKILL", 0.9)]
+        memory.find_similar = lambda activation, top_k=1: _FIXED_SIMILAR
 
         optimizer = GCAOptimizer(glassbox, memory)
 
-        # Fill cache to limit (1000)
-        limit = 1000
-        for i in range(limit):
-            optimizer.route_intent(f"key_{i}")
+        # Fill cache to limit (batched; LRU behavior itself is exercised
+        # through route_intent below)
+        limit = optimizer.CACHE_LIMIT
+        optimizer._prime_cache(f"key_{i}" for i in range(limit))
 
         # Cache has key_0 ... key_999.
         # Access key_0. This should move it to the end (newest).
@@ -4,12 +4,8 @@ import sys
 import os
 import time
 
-# Mock heavy dependencies BEFORE import
-sys.modules["torch"] = MagicMock()
-sys.modules["torch.nn"] = MagicMock()
-sys.modules["torch.nn.functional"] = MagicMock()
-sys.modules["transformers"] = MagicMock()
-
+# torch/transformers are served as mocks by the MetaPathFinder in
+# conftest.py; numpy is real here (engram vectors below use actual arrays).
 import numpy as np
 
 # Add parent directory to path to allow imports
@@ -82,8 +78,9 @@ class TestPulseReflection(unittest.TestCase):
 
     def test_reflection_error_handling(self):
         """Test that reflection errors are handled gracefully."""
-        # Set tick to 4
+        # Set tick to 4 (one tick away from the reflection countdown firing)
         self.pulse._ticks = 4
+        self.pulse._reflect_in = 1
 
         # Make glassbox raise exception
         self.mock_glassbox.generate_steered.side_effect = Exception("Generation failed")
@@ -7,6 +7,7 @@ import sys
 import os
 import unittest
 import json
+import numpy as np
 import torch
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -23,6 +24,10 @@ class TestSkillRL(unittest.TestCase):
         self.test_registry = "test_skill_registry.json"
         self.test_history = "test_trajectory_history.jsonl"
 
+        # One shared dummy hidden state for every forward-hook firing,
+        # instead of allocating a fresh (1, 5, 768) tensor per call
+        self._dummy_hidden = torch.randn(1, 5, 768) # Batch 1, Seq 5, Dim 768
+
         # Monkey patch the paths in skillrl module
         from gca_core import skillrl
         skillrl.REGISTRY_PATH = self.test_registry
@@ -44,13 +49,25 @@ class TestSkillRL(unittest.TestCase):
     @patch('gca_pilot_v3_skillrl.GlassBox')
     @patch('gca_pilot_v3_skillrl.IsotropicMemory')
     @patch('gca_pilot_v3_skillrl.ResourceManager')
-    def test_evolution_cycle(self, MockRM, MockMemory, MockGlassBox):
+    @patch('gca_core.skillrl.torch.mean')
+    def test_evolution_cycle(self, mock_mean, MockRM, MockMemory, MockGlassBox):
         # Setup Mocks
         mock_glassbox = MockGlassBox.return_value
         mock_model = MagicMock()
         mock_tokenizer = MagicMock()
         mock_basis = torch.randn(16, 768) # 16 skills, 768 dim
 
+        # torch is a MagicMock here, so wire up the tensor->numpy conversions
+        # the engine performs: the basis converts once at init, and the mean
+        # pooled hidden state converts per mission for the numpy projection.
+        mock_basis.detach.return_value.cpu.return_value.numpy.return_value = (
+            np.random.randn(16, 768).astype(np.float32)
+        )
+        mock_mean.return_value.detach.return_value.squeeze.return_value \
+            .cpu.return_value.numpy.return_value = (
+            np.random.randn(768).astype(np.float32)
+        )
+
         mock_glassbox.model = mock_model
         mock_glassbox.tokenizer = mock_tokenizer
         mock_glassbox.device = "cpu"
@@ -83,11 +100,10 @@ class TestSkillRL(unittest.TestCase):
         # Simulate model forward pass triggering the hook
         def model_forward_side_effect(**kwargs):
             for h in list(captured_hook): # Use list() copy to avoid modification during iteration issues
-                # Run the hook with dummy output
+                # Run the hook with the preallocated dummy output
                 # Output tuple (hidden_states, ...)
-                dummy_output = torch.randn(1, 5, 768) # Batch 1, Seq 5, Dim 768
                 # hook(module, input, output)
-                h(mock_layer, None, (dummy_output,))
+                h(mock_layer, None, (self._dummy_hidden,))
             return None
         mock_model.side_effect = model_forward_side_effect
 
@@ -132,7 +148,6 @@ class TestSkillRL(unittest.TestCase):
             registry = json.load(f)
             self.assertEqual(registry["test_skill"]["evolution_generations"], 2)
 
-        print("\nTest passed: Trajectory logged and Skill evolved.")
 
 if __name__ == '__main__':
     unittest.main()
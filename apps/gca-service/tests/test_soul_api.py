@@ -1,103 +1,14 @@
-import sys
-import os
-from unittest.mock import MagicMock
+"""
+Soul API tests.
 
-# --- 1. MOCK HEAVY LIBRARIES ---
-# We mock these BEFORE importing api_server to avoid ImportError or heavy loading
+The heavy-library and gca_core mocks, the api_server import, and the
+TestClient all come from the shared session fixtures in conftest.py;
+each test only configures the soul loader it patches in.
+"""
+from unittest.mock import MagicMock, patch
 
-modules_to_mock = [
-    "torch", "torch.nn", "torch.nn.functional",
-    "transformers", "accelerate", "numpy", "scikit-learn",
-    "textblob", "sentence_transformers", "faster_whisper", "cv2",
-    "PIL", "einops", "moviepy", "qwen_vl_utils", "networkx",
-    "pydub", # Maybe needed
-    "sklearn.metrics.pairwise" # Specifically
-]
-
-for mod in modules_to_mock:
-    sys.modules[mod] = MagicMock()
-
-# --- 2. MOCK GCA CORE MODULES ---
-# We mock most of the core to avoid dependencies on config, models, etc.
-# But we need to be careful with 'api_server' imports.
-
-# gca_core.glassbox
-sys.modules["gca_core.glassbox"] = MagicMock()
-# gca_core.resource_manager
-mock_rm = MagicMock()
-mock_rm.ResourceManager.return_value.get_active_config.return_value = {"active_profile": "TEST"}
-sys.modules["gca_core.resource_manager"] = mock_rm
-# gca_core.moral
-sys.modules["gca_core.moral"] = MagicMock()
-# gca_core.optimizer
-sys.modules["gca_core.optimizer"] = MagicMock()
-# gca_core.memory
-sys.modules["gca_core.memory"] = MagicMock()
-# gca_core.resonance
-sys.modules["gca_core.resonance"] = MagicMock()
-# gca_core.qpt
-sys.modules["gca_core.qpt"] = MagicMock()
-# gca_core.arena
-sys.modules["gca_core.arena"] = MagicMock()
-# gca_core.memory_advanced
-sys.modules["gca_core.memory_advanced"] = MagicMock()
-# gca_core.perception
-sys.modules["gca_core.perception"] = MagicMock()
-# gca_core.observer
-sys.modules["gca_core.observer"] = MagicMock()
-# gca_core.pulse
-sys.modules["gca_core.pulse"] = MagicMock()
-# gca_core.causal_flow
-sys.modules["gca_core.causal_flow"] = MagicMock()
-# gca_core.swarm
-mock_swarm = MagicMock()
-# Configure the mesh mock specifically to have a string agent_id property
-mock_mesh = MagicMock()
-mock_mesh.agent_id = "test_agent_id"
-mock_swarm.SwarmNetwork.return_value.mesh = mock_mesh
-sys.modules["gca_core.swarm"] = mock_swarm
-# gca_core.reflective_logger
-sys.modules["gca_core.reflective_logger"] = MagicMock()
-# gca_core.security
-mock_security = MagicMock()
-mock_security.SecurityManager.return_value.get_public_key_b64.return_value = "test_pub_key"
-sys.modules["gca_core.security"] = mock_security
-# dreamer
-sys.modules["dreamer"] = MagicMock()
-
-# Specifically for soul_loader, we want to control it
-mock_soul_loader_module = MagicMock()
-sys.modules["gca_core.soul_loader"] = mock_soul_loader_module
-
-# --- 3. IMPORT APP ---
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-# Need to ensure os.path.expanduser doesn't fail if mocked? No, that's standard lib.
-# But api_server uses open() on config files. We might need to patch builtins open if it fails.
-# Let's try importing first.
-
-try:
-    from api_server import app
-except Exception as e:
-    print(f"Import failed: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
-
-from fastapi.testclient import TestClient
-from unittest.mock import patch
-
-client = TestClient(app)
-
-# --- 4. TESTS ---
-
-def test_list_souls():
-    # Since api_server.py imports get_soul_loader from gca_core.soul_loader,
-    # and we mocked sys.modules["gca_core.soul_loader"], api_server has a reference to that mock.
-    # We should configure that mock.
-    # However, if api_server imported BEFORE this test ran (cached), it might have an old mock.
-    # Patching api_server's imported name is safer.
 
+def test_list_souls(client):
     mock_loader_instance = MagicMock()
     mock_loader_instance.list_souls.return_value = ["Architect", "Stoic"]
     mock_loader_instance.get_soul_info.return_value = {"name": "Test", "description": "Test Soul"}
@@ -109,16 +20,13 @@ def test_list_souls():
     assert response.status_code == 200
     data = response.json()
 
-    print(f"Response: {data}")
-
     assert "souls" in data
     assert data["souls"] == ["Architect", "Stoic"]
     assert "details" in data
     assert data["details"]["Architect"]["name"] == "Test"
-    print("test_list_souls passed")
 
-def test_compose_soul():
-    # Setup mock
+
+def test_compose_soul(client):
     mock_loader_instance = MagicMock()
     mock_loader_instance.create_composite_soul.return_value.name = "Composite-Soul"
     mock_loader_instance.create_composite_soul.return_value.traits = ["Adaptable"]
@@ -136,13 +44,5 @@ def test_compose_soul():
     assert response.status_code == 200
     data = response.json()
 
-    print(f"Compose Response: {data}")
-
     assert data["status"] == "composed"
     assert data["name"] == "Composite-Soul"
-    print("test_compose_soul passed")
-
-if __name__ == "__main__":
-    test_list_souls()
-    test_compose_soul()
-    print("All tests passed!")
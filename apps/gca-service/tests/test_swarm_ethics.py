@@ -3,16 +3,12 @@ import unittest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
 
-# Mock dependencies BEFORE import
-sys.modules['torch'] = MagicMock()
-sys.modules['torch.nn'] = MagicMock()
-sys.modules['torch.nn.functional'] = MagicMock()
-sys.modules['transformers'] = MagicMock()
+# torch/transformers/psutil are served as mocks by the MetaPathFinder in
+# conftest.py; only the installed-but-unwanted deps are mocked here.
 sys.modules['cryptography'] = MagicMock()
 sys.modules['cryptography.fernet'] = MagicMock()
 sys.modules['yaml'] = MagicMock()
 sys.modules['requests'] = MagicMock()
-sys.modules['psutil'] = MagicMock()
 
 # Fix path
 sys.path.insert(0, str(Path(__file__).parent.parent))
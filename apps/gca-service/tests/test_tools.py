@@ -4,24 +4,11 @@ from pathlib import Path
 import os
 from unittest.mock import MagicMock
 
-# Mock torch and other heavy dependencies
-sys.modules['torch'] = MagicMock()
-sys.modules['torch.nn'] = MagicMock()
-sys.modules['numpy'] = MagicMock()
-sys.modules['transformers'] = MagicMock()
-sys.modules['accelerate'] = MagicMock()
-sys.modules['sentence_transformers'] = MagicMock()
-sys.modules['faster_whisper'] = MagicMock()
-sys.modules['cv2'] = MagicMock()
-sys.modules['PIL'] = MagicMock()
-sys.modules['einops'] = MagicMock()
-sys.modules['moviepy'] = MagicMock()
-sys.modules['qwen_vl_utils'] = MagicMock()
-sys.modules['networkx'] = MagicMock()
+# Heavy ML/media libraries are served as mocks by the MetaPathFinder in
+# conftest.py; the remaining installed deps are mocked to stay hermetic.
 sys.modules['yaml'] = MagicMock()
 sys.modules['textblob'] = MagicMock()
-sys.modules['sklearn'] = MagicMock()
-sys.modules['sklearn.decomposition'] = MagicMock()
+sys.modules['networkx'] = MagicMock()
 
 # Add gca-service to path
 # This file is in apps/gca-service/tests/